@@ -155,6 +155,9 @@ class Backend(GridObjects, ABC):
         self.comp_time = 0.0
         self.can_output_theta = False
 
+        # whether the backend implements the `snapshot` / `restore` methods
+        self.can_snapshot = False
+
         # to prevent the use of the same backend instance in different environment.
         self._is_loaded = False
 
@@ -488,6 +491,71 @@ class Backend(GridObjects, ABC):
         res._is_loaded = False  # i can reload a copy of an environment
         return res
 
+    def snapshot(self):
+        """
+        .. versionadded:: 1.8.2
+
+        .. note::
+            This function is not mandatory. If you implement it, don't forget to set
+            the flag :attr:`Backend.can_snapshot` to ``True``.
+
+            When it is not available, grid2op uses :func:`Backend.copy` instead.
+
+        Returns the "mutable" state of the backend, that is everything that can be modified by
+        :func:`Backend.apply_action`, :func:`Backend.runpf` or the `_disconnect_line` / `_reconnect_line`
+        functions (injections, buses of the elements, status of the elements, results of the last
+        powerflow, thermal limits etc.)
+
+        The state should be made of "flat" objects (numpy arrays, floats etc.) and should not contain
+        anything that does not change between two steps (for example the characteristics of the powerlines).
+        It is then much faster to make than a copy of the backend.
+
+        This state can be used with :func:`Backend.restore` (on this backend, or on any other backend of the same
+        class that loaded the same powergrid, for example a copy of this one) to get back to this exact state.
+
+        Returns
+        -------
+        res:
+            The state of the backend, that can be given to :func:`Backend.restore`
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            snap = backend.snapshot()
+            backend._disconnect_line(0)
+            backend.runpf()
+            # do something with the results
+            backend.restore(snap)  # backend is in the same state as before the disconnection
+
+        """
+        raise NotImplementedError(
+            "This backend does not support the \"snapshot\" / \"restore\" features."
+        )
+
+    def restore(self, snapshot):
+        """
+        .. versionadded:: 1.8.2
+
+        .. note::
+            This function is not mandatory. If you implement it, don't forget to set
+            the flag :attr:`Backend.can_snapshot` to ``True``.
+
+        Put back the backend in the state it was when `snapshot` was made (see :func:`Backend.snapshot`).
+
+        It should not allocate new memory (only write in the existing "vectors" of the backend) when possible.
+
+        Parameters
+        ----------
+        snapshot:
+            A state of a backend, obtained with :func:`Backend.snapshot`
+
+        """
+        raise NotImplementedError(
+            "This backend does not support the \"snapshot\" / \"restore\" features."
+        )
+
     def save_file(self, full_path):
         """
         INTERNAL
@@ -846,6 +914,79 @@ class Backend(GridObjects, ABC):
         bk_act += action
         self.apply_action(bk_act)
 
+    def _disconnect_lines(self, lines_id):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using the action space to disconnect powerlines.
+
+        Disconnect all the powerlines in `lines_id` in the backend. It is used when computing the cascading
+        failures (see :func:`Backend.next_grid_state`) to disconnect all the overflowing powerlines of a
+        "round" at once.
+
+        By default it calls :func:`Backend._disconnect_line` for each powerline. It can be overloaded to
+        perform a single modification of the powergrid.
+
+        Parameters
+        ----------
+        lines_id: ``numpy.ndarray``, dtype:int
+            The id of the powerlines to disconnect
+
+        """
+        for l_id in lines_id:
+            self._disconnect_line(l_id)
+
+    def _warm_start_next_pf(self, is_dc):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Tells the backend that the next powerflow can be initialized with the results of the last
+        one. It is called when computing the cascading failures (see :func:`Backend.next_grid_state`) where only
+        a few powerlines are disconnected between two consecutive powerflows.
+
+        It does nothing by default.
+
+        Parameters
+        ----------
+        is_dc: ``bool``
+            Whether the last powerflow was computed using the DC approximation
+        """
+        pass
+
+    def _cascading_failure_snapshot(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Returns the information stored after each powerflow computed during the cascading failures
+        when :attr:`Backend.detailed_infos_for_cascading_failures` is ``True``.
+
+        Returns
+        -------
+        res: ``dict``
+            A dictionary with keys "line_status", "p_or", "q_or", "v_or", "a_or", "p_ex", "q_ex",
+            "v_ex" and "a_ex", each value being a copy of the corresponding vector.
+        """
+        p_or, q_or, v_or, a_or = self.lines_or_info()
+        p_ex, q_ex, v_ex, a_ex = self.lines_ex_info()
+        res = {
+            "line_status": copy.deepcopy(self.get_line_status()),
+            "p_or": 1.0 * p_or,
+            "q_or": 1.0 * q_or,
+            "v_or": 1.0 * v_or,
+            "a_or": 1.0 * a_or,
+            "p_ex": 1.0 * p_ex,
+            "q_ex": 1.0 * q_ex,
+            "v_ex": 1.0 * v_ex,
+            "a_ex": 1.0 * a_ex,
+        }
+        return res
+
     def _runpf_with_diverging_exception(self, is_dc):
         """
         INTERNAL
@@ -911,9 +1052,15 @@ class Backend(GridObjects, ABC):
             or ``False`` otherwise.
 
         infos: ``list``
-            If :attr:`Backend.detailed_infos_for_cascading_failures` is ``True`` then it returns the different
-            state computed by the powerflow (can drastically slow down this function, as it requires
-            deep copy of backend object). Otherwise the list is always empty.
+            If :attr:`Backend.detailed_infos_for_cascading_failures` is ``True`` then it returns the flows
+            computed by each powerflow of the cascading failure (see :func:`Backend._cascading_failure_snapshot`).
+            Otherwise the list is always empty.
+
+        Notes
+        -----
+        All the powerlines disconnected at the same "round" of the cascading failure are disconnected at once
+        (see :func:`Backend._disconnect_lines`) and each powerflow is initialized with the results of the previous
+        one (see :func:`Backend._warm_start_next_pf`).
 
         """
         infos = []
@@ -948,15 +1095,15 @@ class Backend(GridObjects, ABC):
                 # no powerlines have been disconnected at this time step, i stop the computation there
                 break
             disconnected_during_cf[to_disc] = ts
-            # perform the disconnection action
-            for i, el in enumerate(to_disc):
-                if el:
-                    self._disconnect_line(i)
+            # next powerflow will start from the current solution
+            self._warm_start_next_pf(is_dc)
+            # perform the disconnection action (all at once)
+            self._disconnect_lines(np.where(to_disc)[0])
 
             # start a powerflow on this new state
             conv_ = self._runpf_with_diverging_exception(is_dc)
             if self.detailed_infos_for_cascading_failures:
-                infos.append(self.copy())
+                infos.append(self._cascading_failure_snapshot())
 
             if conv_ is not None:
                 break
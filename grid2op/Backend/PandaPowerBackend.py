@@ -15,6 +15,8 @@ import numpy as np
 import pandas as pd
 
 import pandapower as pp
+from pandapower.pypower.idx_brch import F_BUS, T_BUS, PF, QF, PT, QT
+from pandapower.pypower.idx_bus import VM, VA, BASE_KV
 import scipy
 
 from grid2op.dtypes import dt_int, dt_float, dt_bool
@@ -185,6 +187,8 @@ class PandaPowerBackend(Backend):
         self._big_topo_to_obj = None
         self._big_topo_to_backend = None
         self.__pp_backend_initial_grid = None  # initial state to facilitate the "reset"
+        self._ppc_branch_id = None  # rows of the powerlines in the "branch" of pandapower "ppc"
+        self._load_gen_same_sub = None  # (load, gen) pairs that are in the same substation
 
         # Mapping some fun to apply bus updates
         self._type_to_bus_set = [
@@ -201,6 +205,7 @@ class PandaPowerBackend(Backend):
 
         # TODO storage doc (in grid2op rst) of the backend
         self.can_output_theta = True  # I support the voltage angle
+        self.can_snapshot = True  # I support the "snapshot" / "restore" feature
         self.theta_or = None
         self.theta_ex = None
         self.load_theta = None
@@ -861,17 +866,123 @@ class PandaPowerBackend(Backend):
                     )
 
         # i made at least a real change, so i implement it in the backend
-        for id_el, new_bus in topo__:
-            id_el_backend, id_topo, type_obj = self._big_topo_to_backend[id_el]
+        # (storage units are handled above)
+        if np.any(topo__.changed):
+            self._apply_topo_vect(topo__.changed, topo__.values)
+
+        # no iloc for bus, don't ask me why please :-/ (buses are identified by their label)
+        bus_label = np.arange(active_bus.shape[0])
+        bus_pos = self._grid.bus.index.get_indexer(
+            np.concatenate((bus_label, bus_label + self.__nb_bus_before))
+        )
+        self._grid.bus["in_service"].values[bus_pos] = np.concatenate(
+            (active_bus[:, 0], active_bus[:, 1])
+        )
+
+    def _apply_topo_vect(self, topo_changed, topo_values):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Apply the modifications of the topology (for loads, generators, powerlines and transformers) to the
+        pandapower grid. Modified elements are grouped by pandapower table so that each column
+        ("bus", "in_service", "from_bus" etc.) is written with a single numpy assignment.
+
+        It has the same effect as calling, for each modified element, the corresponding function
+        in `self._type_to_bus_set` (for example :func:`PandaPowerBackend._apply_load_bus`).
+        """
+        # loads and generators
+        load_id, load_bus, _ = self._aux_get_new_pp_bus(
+            self.load_pos_topo_vect, self._init_bus_load, topo_changed, topo_values
+        )
+        self._aux_apply_inj_bus(self._grid.load, load_id, load_bus)
+
+        gen_id, gen_bus, _ = self._aux_get_new_pp_bus(
+            self.gen_pos_topo_vect, self._init_bus_gen, topo_changed, topo_values
+        )
+        self._aux_apply_inj_bus(self._grid.gen, gen_id, gen_bus)
+        if self._iref_slack is not None and gen_id.shape[0]:
+            # remember in this case slack bus is actually 2 generators for pandapower !
+            is_slack = gen_id == (self._grid.gen.shape[0] - 1)
+            if np.any(is_slack) and gen_bus[is_slack][0] >= 0:
+                # in this case the slack bus cannot be disconnected
+                self._grid.ext_grid["bus"].iat[0] = gen_bus[is_slack][0]
+
+        # powerlines and transformers
+        lor_id, lor_bus, lor_pos = self._aux_get_new_pp_bus(
+            self.line_or_pos_topo_vect, self._init_bus_lor, topo_changed, topo_values
+        )
+        lex_id, lex_bus, lex_pos = self._aux_get_new_pp_bus(
+            self.line_ex_pos_topo_vect, self._init_bus_lex, topo_changed, topo_values
+        )
+        nb_line = self.__nb_powerline
+        is_line_or = lor_id < nb_line
+        is_line_ex = lex_id < nb_line
+        self._aux_apply_branch_bus(
+            self._grid.line,
+            ("from_bus", "to_bus"),
+            (lor_id[is_line_or], lor_bus[is_line_or], lor_pos[is_line_or]),
+            (lex_id[is_line_ex], lex_bus[is_line_ex], lex_pos[is_line_ex]),
+        )
+        self._aux_apply_branch_bus(
+            self._grid.trafo,
+            ("hv_bus", "lv_bus"),
+            (lor_id[~is_line_or] - nb_line, lor_bus[~is_line_or], lor_pos[~is_line_or]),
+            (lex_id[~is_line_ex] - nb_line, lex_bus[~is_line_ex], lex_pos[~is_line_ex]),
+        )
+
+    def _aux_get_new_pp_bus(self, pos_topo_vect, bus_init, topo_changed, topo_values):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Vectorized version of :func:`PandaPowerBackend._pp_bus_from_grid2op_bus`.
+
+        Returns the id of the modified elements (of a given type), their new pandapower bus (-1 if disconnected)
+        and their position in the topology vector.
+        """
+        el_id = np.where(topo_changed[pos_topo_vect])[0]
+        el_pos = pos_topo_vect[el_id]
+        new_bus = topo_values[el_pos]
+        if np.any((new_bus != 1) & (new_bus != 2) & (new_bus != -1)):
+            raise BackendError("grid2op bus must be -1, 1 or 2")
+        new_bus_pp = bus_init[el_id].astype(dt_int)
+        new_bus_pp[new_bus == 2] += self.__nb_bus_before
+        new_bus_pp[new_bus == -1] = -1
+        return el_id, new_bus_pp, el_pos
 
-            if type_obj is not None:
-                # storage unit are handled elsewhere
-                self._type_to_bus_set[type_obj](new_bus, id_el_backend, id_topo)
+    @staticmethod
+    def _aux_apply_inj_bus(table, el_id, new_bus_pp):
+        if el_id.shape[0] == 0:
+            return
+        connected = new_bus_pp >= 0
+        table["in_service"].values[el_id] = connected
+        if np.all(connected):
+            table["bus"].values[el_id] = new_bus_pp
+        else:
+            # "-1" does not fit in the (unsigned) type used by pandapower for the buses
+            # so i let pandas handle the conversion
+            table.iloc[el_id, table.columns.get_loc("bus")] = new_bus_pp
 
-        bus_is = self._grid.bus["in_service"]
-        for i, (bus1_status, bus2_status) in enumerate(active_bus):
-            bus_is[i] = bus1_status  # no iloc for bus, don't ask me why please :-/
-            bus_is[i + self.__nb_bus_before] = bus2_status
+    @staticmethod
+    def _aux_apply_branch_bus(table, bus_cols, or_info, ex_info):
+        id_or, bus_or, pos_or = or_info
+        id_ex, bus_ex, pos_ex = ex_info
+        if id_or.shape[0] == 0 and id_ex.shape[0] == 0:
+            return
+        col_or, col_ex = bus_cols
+        table[col_or].values[id_or[bus_or >= 0]] = bus_or[bus_or >= 0]
+        table[col_ex].values[id_ex[bus_ex >= 0]] = bus_ex[bus_ex >= 0]
+
+        # if both sides of a branch are modified, its status is given by the last one
+        # (in the topology vector order)
+        br_id = np.concatenate((id_or, id_ex))
+        br_status = np.concatenate((bus_or >= 0, bus_ex >= 0))
+        order = np.argsort(np.concatenate((pos_or, pos_ex)))[::-1]
+        br_id, first_ = np.unique(br_id[order], return_index=True)
+        table["in_service"].values[br_id] = br_status[order][first_]
 
     def _apply_load_bus(self, new_bus, id_el_backend, id_topo):
         new_bus_backend = self._pp_bus_from_grid2op_bus(
@@ -974,6 +1085,95 @@ class PandaPowerBackend(Backend):
         )
         return res
 
+    def _aux_get_ppc_branch_id(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Rows, in the "branch" matrix of the pandapower "ppc", of all the powerlines
+        (first the "line" then the "trafo", in the grid2op order). These rows only depend on the size of the
+        "line" and "trafo" tables so they are computed once.
+        """
+        if self._ppc_branch_id is None:
+            lookups = self._grid._pd2ppc_lookups["branch"]
+            res = []
+            for table in ("line", "trafo"):
+                if table in lookups:
+                    f, t = lookups[table]
+                    res.append(np.arange(f, t))
+            self._ppc_branch_id = np.concatenate(res).astype(dt_int)
+        return self._ppc_branch_id
+
+    def _aux_get_branch_results(self, is_dc):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Retrieve the flows on the powerlines (p_or, q_or, v_or, a_or, theta_or and their counterpart on the
+        extremity side) directly from the "ppc" internal structure of pandapower
+        (where pandapower itself reads them to fill its `res_line` and `res_trafo` tables),
+        and write them into the pre allocated vectors of the backend.
+
+        It gives the same results as reading the `res_line` and `res_trafo` tables
+        (with the same conventions, for example the reactive power on transformers is set to 0. in DC).
+        """
+        ppc = self._grid._ppc
+        branch = ppc["branch"][self._aux_get_ppc_branch_id()]
+        bus = ppc["bus"]
+        bus_or = branch[:, F_BUS].real.astype(dt_int)
+        bus_ex = branch[:, T_BUS].real.astype(dt_int)
+
+        self.p_or[:] = branch[:, PF].real
+        self.q_or[:] = branch[:, QF].real
+        self.p_ex[:] = branch[:, PT].real
+        self.q_ex[:] = branch[:, QT].real
+        self.v_or[:] = bus[bus_or, VM]
+        self.v_ex[:] = bus[bus_ex, VM]
+        self.theta_or[:] = bus[bus_or, VA]
+        self.theta_ex[:] = bus[bus_ex, VA]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # current flows, in A (pandapower compute them in kA)
+            self.a_or[:] = (
+                1000.0 * np.sqrt(branch[:, PF].real ** 2 + branch[:, QF].real ** 2)
+                / (bus[bus_or, VM] * bus[bus_or, BASE_KV] * np.sqrt(3.0))
+            )
+            self.a_ex[:] = (
+                1000.0 * np.sqrt(branch[:, PT].real ** 2 + branch[:, QT].real ** 2)
+                / (bus[bus_ex, VM] * bus[bus_ex, BASE_KV] * np.sqrt(3.0))
+            )
+        if is_dc:
+            # pandapower does not report reactive power on transformers in DC
+            self.q_or[self._number_true_line:] = 0.0
+            self.q_ex[self._number_true_line:] = 0.0
+
+    def _aux_load_gen_same_bus(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        For each load connected to the same bus as a generator, returns the id of this load and of the
+        first generator (with the lowest id) connected on the same bus.
+
+        The pairs (load, generator) that are in the same substation are computed once (in `self._load_gen_same_sub`).
+        """
+        if self._load_gen_same_sub is None:
+            load_id, gen_id = np.where(
+                self.load_to_subid.reshape(-1, 1) == self.gen_to_subid.reshape(1, -1)
+            )
+            self._load_gen_same_sub = (load_id.astype(dt_int), gen_id.astype(dt_int))
+        load_id, gen_id = self._load_gen_same_sub
+        same_bus = (
+            self._grid.load["bus"].values[load_id] == self._grid.gen["bus"].values[gen_id]
+        )
+        load_id = load_id[same_bus]
+        gen_id = gen_id[same_bus]
+        # pairs are sorted by load id then by gen id, so i keep the first one for each load
+        load_id, first_ = np.unique(load_id, return_index=True)
+        return load_id, gen_id[first_]
+
     def runpf(self, is_dc=False):
         """
         INTERNAL
@@ -1063,39 +1263,14 @@ class PandaPowerBackend(Backend):
                     # self._grid.res_bus["vm_pu"] is always nan when computed in DC
                     self.load_v[:] = self.load_pu_to_kv  # TODO
                     # need to assign the correct value when a generator is present at the same bus
-                    # TODO optimize this ugly loop
-                    for l_id in range(self.n_load):
-                        if self.load_to_subid[l_id] in self.gen_to_subid:
-                            ind_gens = np.where(
-                                self.gen_to_subid == self.load_to_subid[l_id]
-                            )[0]
-                            for g_id in ind_gens:
-                                if (
-                                    self._topo_vect[self.load_pos_topo_vect[l_id]]
-                                    == self._topo_vect[self.load_pos_topo_vect[g_id]]
-                                ):
-                                    self.load_v[l_id] = self.prod_v[g_id]
-                                    break
+                    load_id, gen_id = self._aux_load_gen_same_bus()
+                    self.load_v[load_id] = self.prod_v[gen_id]
 
                 self.line_status[:] = self._get_line_status()
-                # I retrieve the data once for the flows, so has to not re read multiple dataFrame
-                self.p_or[:] = self._aux_get_line_info("p_from_mw", "p_hv_mw")
-                self.q_or[:] = self._aux_get_line_info("q_from_mvar", "q_hv_mvar")
-                self.v_or[:] = self._aux_get_line_info("vm_from_pu", "vm_hv_pu")
-                self.a_or[:] = self._aux_get_line_info("i_from_ka", "i_hv_ka") * 1000
-                self.theta_or[:] = self._aux_get_line_info(
-                    "va_from_degree", "va_hv_degree"
-                )
+                # I retrieve the flows directly from the results of the powerflow (no dataframe involved)
+                self._aux_get_branch_results(is_dc)
                 self.a_or[~np.isfinite(self.a_or)] = 0.0
                 self.v_or[~np.isfinite(self.v_or)] = 0.0
-
-                self.p_ex[:] = self._aux_get_line_info("p_to_mw", "p_lv_mw")
-                self.q_ex[:] = self._aux_get_line_info("q_to_mvar", "q_lv_mvar")
-                self.v_ex[:] = self._aux_get_line_info("vm_to_pu", "vm_lv_pu")
-                self.a_ex[:] = self._aux_get_line_info("i_to_ka", "i_lv_ka") * 1000
-                self.theta_ex[:] = self._aux_get_line_info(
-                    "va_to_degree", "va_lv_degree"
-                )
                 self.a_ex[~np.isfinite(self.a_ex)] = 0.0
                 self.v_ex[~np.isfinite(self.v_ex)] = 0.0
 
@@ -1255,6 +1430,8 @@ class PandaPowerBackend(Backend):
         res._get_vector_inj = copy.deepcopy(self._get_vector_inj)
         res._big_topo_to_obj = copy.deepcopy(self._big_topo_to_obj)
         res._big_topo_to_backend = copy.deepcopy(self._big_topo_to_backend)
+        res._ppc_branch_id = copy.deepcopy(self._ppc_branch_id)
+        res._load_gen_same_sub = copy.deepcopy(self._load_gen_same_sub)
         res.__pp_backend_initial_grid = copy.deepcopy(self.__pp_backend_initial_grid)
 
         # Mapping some fun to apply bus updates
@@ -1289,6 +1466,97 @@ class PandaPowerBackend(Backend):
         del self.__pp_backend_initial_grid
         self.__pp_backend_initial_grid = None
 
+    # columns of the pandapower tables that are stored in a snapshot (see `snapshot`)
+    _snapshot_grid_cols = {
+        "load": ("p_mw", "q_mvar", "bus", "in_service"),
+        "gen": ("p_mw", "vm_pu", "bus", "in_service"),
+        "ext_grid": ("vm_pu", "bus"),
+        "line": ("from_bus", "to_bus", "in_service"),
+        "trafo": ("hv_bus", "lv_bus", "in_service"),
+        "bus": ("in_service",),
+        "shunt": ("p_mw", "q_mvar", "bus", "in_service"),
+        "storage": ("p_mw", "bus", "in_service"),
+        # results of the last powerflow: used to warm start the next one and read by `shunt_info`
+        "res_bus": ("vm_pu", "va_degree"),
+        "res_shunt": ("p_mw", "q_mvar"),
+    }
+    # vectors of the backend that are stored in a snapshot
+    _snapshot_backend_attr = (
+        "p_or", "q_or", "v_or", "a_or", "theta_or",
+        "p_ex", "q_ex", "v_ex", "a_ex", "theta_ex",
+        "prod_p", "prod_q", "prod_v", "gen_theta",
+        "load_p", "load_q", "load_v", "load_theta",
+        "storage_p", "storage_q", "storage_v", "storage_theta",
+        "line_status", "_topo_vect", "thermal_limit_a",
+    )
+
+    def snapshot(self):
+        """
+        .. versionadded:: 1.8.2
+
+        See :func:`grid2op.Backend.Backend.snapshot` for more information.
+
+        For pandapower, only the columns of the pandapower tables that can be modified (injections, buses,
+        status and results used for the warm start of the powerflow) are stored, as numpy arrays.
+        """
+        grid_state = {
+            (table, col): self._grid[table][col].values.copy()
+            for table, cols in self._snapshot_grid_cols.items()
+            for col in cols
+        }
+        backend_state = {
+            attr_nm: copy.deepcopy(getattr(self, attr_nm))
+            for attr_nm in self._snapshot_backend_attr
+        }
+        # result tables might not have the same size in all backends (they are resized by pandapower
+        # when a powerflow is computed) so i keep their index
+        res_index = {
+            table: self._grid[table].index.values.copy()
+            for table in self._snapshot_grid_cols
+            if table.startswith("res_")
+        }
+        return {
+            "grid": grid_state,
+            "res_index": res_index,
+            "backend": backend_state,
+            "converged": self._grid.converged,
+            "_nb_bus_before": self._nb_bus_before,
+            "_pf_init": self._pf_init,
+        }
+
+    def restore(self, snapshot):
+        """
+        .. versionadded:: 1.8.2
+
+        See :func:`grid2op.Backend.Backend.restore` for more information.
+        """
+        for table, index in snapshot["res_index"].items():
+            if self._grid[table].shape[0] != index.shape[0]:
+                self._grid[table] = self._grid[table].reindex(index)
+
+        for (table, col), val in snapshot["grid"].items():
+            col_vals = self._grid[table][col].values
+            if col_vals.dtype == val.dtype and col_vals.shape == val.shape:
+                col_vals[:] = val
+            else:
+                # the type of the column changed (for example a bus has been set to -1)
+                self._grid[table][col] = val.copy()
+
+        for attr_nm, val in snapshot["backend"].items():
+            this_val = getattr(self, attr_nm)
+            if (
+                isinstance(this_val, np.ndarray)
+                and isinstance(val, np.ndarray)
+                and this_val.shape == val.shape
+            ):
+                this_val[:] = val
+            else:
+                setattr(self, attr_nm, copy.deepcopy(val))
+
+        self._grid.converged = snapshot["converged"]
+        self._nb_bus_before = snapshot["_nb_bus_before"]
+        self._pf_init = snapshot["_pf_init"]
+
     def save_file(self, full_path):
         """
         INTERNAL
@@ -1334,6 +1602,28 @@ class PandaPowerBackend(Backend):
         self._topo_vect[self.line_ex_pos_topo_vect[id_]] = -1
         self.line_status[id_] = False
 
+    def _disconnect_lines(self, lines_id):
+        lines_id = np.asarray(lines_id, dtype=dt_int)
+        is_line = lines_id < self._number_true_line
+        if np.any(is_line):
+            self._grid.line.iloc[
+                lines_id[is_line], self._grid.line.columns.get_loc("in_service")
+            ] = False
+        if np.any(~is_line):
+            self._grid.trafo.iloc[
+                lines_id[~is_line] - self._number_true_line,
+                self._grid.trafo.columns.get_loc("in_service"),
+            ] = False
+        self._topo_vect[self.line_or_pos_topo_vect[lines_id]] = -1
+        self._topo_vect[self.line_ex_pos_topo_vect[lines_id]] = -1
+        self.line_status[lines_id] = False
+
+    def _warm_start_next_pf(self, is_dc):
+        if not is_dc:
+            # next powerflow will be initialized with the results of this one
+            # if the number of buses does not change (see `runpf`)
+            self._nb_bus_before = self.get_nb_active_bus()
+
     def _reconnect_line(self, id_):
         if id_ < self._number_true_line:
             self._grid.line["in_service"].iloc[id_] = True
@@ -1438,15 +1728,12 @@ class PandaPowerBackend(Backend):
     def _loads_info(self):
         load_p = self.cst_1 * self._grid.res_load["p_mw"].values.astype(dt_float)
         load_q = self.cst_1 * self._grid.res_load["q_mvar"].values.astype(dt_float)
+        bus_pos = self._grid.res_bus.index.get_indexer(self._grid.load["bus"].values)
         load_v = (
-            self._grid.res_bus.loc[self._grid.load["bus"].values][
-                "vm_pu"
-            ].values.astype(dt_float)
+            self._grid.res_bus["vm_pu"].values[bus_pos].astype(dt_float)
             * self.load_pu_to_kv
         )
-        load_theta = self._grid.res_bus.loc[self._grid.load["bus"].values][
-            "va_degree"
-        ].values.astype(dt_float)
+        load_theta = self._grid.res_bus["va_degree"].values[bus_pos].astype(dt_float)
         return load_p, load_q, load_v, load_theta
 
     def generators_info(self):
@@ -1512,16 +1799,15 @@ class PandaPowerBackend(Backend):
             # deactivated from the Environment...
             p_storage = self._grid.res_storage["p_mw"].values.astype(dt_float)
             q_storage = self._grid.res_storage["q_mvar"].values.astype(dt_float)
+            bus_pos = self._grid.res_bus.index.get_indexer(
+                self._grid.storage["bus"].values
+            )
             v_storage = (
-                self._grid.res_bus.loc[self._grid.storage["bus"].values][
-                    "vm_pu"
-                ].values.astype(dt_float)
+                self._grid.res_bus["vm_pu"].values[bus_pos].astype(dt_float)
                 * self.storage_pu_to_kv
             )
             theta_storage = (
-                self._grid.res_bus.loc[self._grid.storage["bus"].values][
-                    "vm_pu"
-                ].values.astype(dt_float)
+                self._grid.res_bus["vm_pu"].values[bus_pos].astype(dt_float)
                 * self.storage_pu_to_kv
             )
         else:
@@ -574,6 +574,13 @@ class BackendConverter(Backend):
         )  # not sure why, but it looks to work this way
         self.target_backend._disconnect_line(id_target)
 
+    def _disconnect_lines(self, lines_id):
+        lines_id_target = self._line_tg2sr[lines_id]
+        self.target_backend._disconnect_lines(lines_id_target)
+
+    def _warm_start_next_pf(self, is_dc):
+        self.target_backend._warm_start_next_pf(is_dc)
+
     def _transform_action(self, source_action):
         # transform the source action into the target backend action
         # source_action: a backend action!
@@ -6,12 +6,13 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 from multiprocessing import Process, Pipe, Array
+from multiprocessing.connection import wait
 import numpy as np
 import warnings
 import time
 
 from grid2op.Exceptions import EnvError
-from grid2op.dtypes import dt_int
+from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Exceptions import Grid2OpException, MultiEnvException
 from grid2op.Space import GridObjects
 from grid2op.Environment import Environment
@@ -43,6 +44,7 @@ class RemoteEnv(Process):
         name=None,
         return_info=True,
         _obs_to_vect=True,
+        shared_memory=None,
     ):
         Process.__init__(self, group=None, target=None, name=name)
 
@@ -70,6 +72,33 @@ class RemoteEnv(Process):
         self._obs_to_vect = _obs_to_vect
         self._comp_time = 0.0
 
+        # shared memory blocks (see `BaseMultiProcessEnvironment`), views on them are
+        # built in the remote process
+        self._shared_memory = shared_memory
+        self._shm_obs = None
+        self._shm_act = None
+        self._shm_reward = None
+        self._shm_done = None
+
+    def _init_shared_memory(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Build the views on the row of the shared memory blocks that are used by this process.
+        """
+        if self._shared_memory is None:
+            return
+        obs, act, reward, done = BaseMultiProcessEnvironment._shared_memory_as_array(
+            *self._shared_memory
+        )
+        self._shm_obs = obs[self.p_id]
+        self._shm_act = act[self.p_id]
+        # slices (and not items) to keep a view on the shared memory
+        self._shm_reward = reward[self.p_id : self.p_id + 1]
+        self._shm_done = done[self.p_id : self.p_id + 1]
+
     def init_env(self):
         """
         INTERNAL
@@ -144,6 +173,7 @@ class RemoteEnv(Process):
     def run(self):
         if self.env is None:
             self.init_env()
+        self._init_shared_memory()
 
         while True:
             cmd, data = self.remote.recv()
@@ -171,10 +201,32 @@ class RemoteEnv(Process):
                 end_ = time.perf_counter()
                 self._comp_time += end_ - beg_
                 self.remote.send((res_obs, reward, done, info))
+            elif cmd == "ss":
+                # perform a step, action and results are in the shared memory
+                beg_ = time.perf_counter()
+                data = self.env.action_space.from_vect(self._shm_act)
+                obs, reward, done, info = self.env.step(data)
+                obs_v = obs.to_vect()
+                if done or np.any(~np.isfinite(obs_v)):
+                    # if done do a reset
+                    obs_v = self.get_obs_ifnotconv()
+                self._shm_obs[:] = obs_v
+                self._shm_reward[:] = reward
+                self._shm_done[:] = done
+                if not self.return_info:
+                    info = None
+                end_ = time.perf_counter()
+                self._comp_time += end_ - beg_
+                # only the information is sent through the pipe
+                self.remote.send(info)
             elif cmd == "r":
                 # perfom a reset
                 obs_v = self.get_obs_ifnotconv()
                 self.remote.send(obs_v)
+            elif cmd == "rs":
+                # perfom a reset, observation is written in the shared memory
+                self._shm_obs[:] = self.get_obs_ifnotconv()
+                self.remote.send(None)
             elif cmd == "c":
                 # close everything
                 self.env.close()
@@ -271,9 +323,30 @@ class BaseMultiProcessEnvironment(GridObjects):
     return_info: ``bool``
         Whether to return the information dictionary or not (might speed up computation)
 
+    use_shared_memory: ``bool``
+        .. versionadded:: 1.8.2
+
+        Whether the actions, observations, rewards and "done" flags are exchanged with the
+        sub environments through pre allocated shared memory blocks (``True``) or sent (pickled)
+        through the pipes (``False``, default). With shared memory, the pipes only carry a small signal
+        (and the information dictionary if `return_info` is ``True``), which is much faster for large grids
+        or for a large number of sub environments.
+
+        In this case, and if `obs_as_class` is ``False``, the observations returned by
+        :func:`BaseMultiProcessEnvironment.step` and :func:`BaseMultiProcessEnvironment.reset` are a view
+        (with shape `(nb_env, obs_dim)`) on the shared memory: they are overwritten at the next call to these
+        functions (copy them if you need to keep them).
+
+        All the sub environments need to have the same observation and action sizes.
+
     """
 
-    def __init__(self, envs, obs_as_class=True, return_info=True, logger=None):
+    def __init__(self,
+                 envs,
+                 obs_as_class=True,
+                 return_info=True,
+                 logger=None,
+                 use_shared_memory=False):
         GridObjects.__init__(self)
         self.__closed = False
         for env in envs:
@@ -289,6 +362,10 @@ class BaseMultiProcessEnvironment(GridObjects):
         _remotes, _work_remotes = zip(*[Pipe() for _ in range(self.nb_env)])
 
         env_params = [sub_env.get_kwargs(with_backend=False) for sub_env in envs]
+        self.use_shared_memory = bool(use_shared_memory)
+        self._shared_memory = None
+        if self.use_shared_memory:
+            self._shared_memory = self._make_shared_memory(envs)
         self._ps = [
             RemoteEnv(
                 env_params=env_,
@@ -301,6 +378,7 @@ class BaseMultiProcessEnvironment(GridObjects):
                 logger=logger.getChild("BaseMultiProcessEnvironment")
                 if logger is not None
                 else None,
+                shared_memory=self._shared_memory,
             )
             for i, (work_remote, remote, env_) in enumerate(
                 zip(_work_remotes, _remotes, env_params)
@@ -322,23 +400,137 @@ class BaseMultiProcessEnvironment(GridObjects):
         self.obs_as_class = obs_as_class
         # self.__return_info = return_info
         self._waiting = True
+        # id of the sub environments for which an action has been sent with `step_async`
+        # but the results have not been retrieved yet
+        self._pending = []
+
+        # views on the shared memory blocks
+        self._shm_obs = None
+        self._shm_act = None
+        self._shm_reward = None
+        self._shm_done = None
+        if self.use_shared_memory:
+            (
+                self._shm_obs,
+                self._shm_act,
+                self._shm_reward,
+                self._shm_done,
+            ) = self._shared_memory_as_array(*self._shared_memory)
+
+    def _make_shared_memory(self, envs):
+        """
+        INTERNAL
 
-    def _send_act(self, actions):
-        for remote, action in zip(self._remotes, actions):
-            vect = action.to_vect()
-            # vect = None  # TODO
-            remote.send(("s", vect))
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Allocate the shared memory blocks used to exchange the observations, actions, rewards and
+        "done" flags with the sub environments. There is one "row" per sub environment in each block.
+        """
+        obs_dim = int(envs[0].observation_space.size())
+        act_dim = int(envs[0].action_space.size())
+        for env in envs:
+            if (
+                env.observation_space.size() != obs_dim
+                or env.action_space.size() != act_dim
+            ):
+                raise MultiEnvException(
+                    "Impossible to use shared memory with sub environments that do not have "
+                    "the same observation and action sizes."
+                )
+        ctype_float = np.ctypeslib.as_ctypes_type(dt_float)
+        obs_mem = Array(ctype_float, int(self.nb_env) * obs_dim, lock=False)
+        act_mem = Array(ctype_float, int(self.nb_env) * act_dim, lock=False)
+        reward_mem = Array(np.ctypeslib.as_ctypes_type(np.float64), int(self.nb_env), lock=False)
+        done_mem = Array(np.ctypeslib.as_ctypes_type(dt_bool), int(self.nb_env), lock=False)
+        return obs_mem, act_mem, reward_mem, done_mem, obs_dim, act_dim
+
+    @staticmethod
+    def _shared_memory_as_array(obs_mem, act_mem, reward_mem, done_mem, obs_dim, act_dim):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Numpy views (no copy) on the shared memory blocks
+        """
+        obs = np.frombuffer(obs_mem, dtype=dt_float).reshape(-1, obs_dim)
+        act = np.frombuffer(act_mem, dtype=dt_float).reshape(-1, act_dim)
+        reward = np.frombuffer(reward_mem, dtype=np.float64)
+        done = np.frombuffer(done_mem, dtype=dt_bool)
+        return obs, act, reward, done
+
+    def _send_act(self, actions, env_ids=None):
+        if env_ids is None:
+            env_ids = range(self.nb_env)
+        if self.use_shared_memory:
+            for env_id, action in zip(env_ids, actions):
+                self._shm_act[env_id, :] = action.to_vect()
+                self._remotes[env_id].send(("ss", None))
+        else:
+            for env_id, action in zip(env_ids, actions):
+                vect = action.to_vect()
+                # vect = None  # TODO
+                self._remotes[env_id].send(("s", vect))
         self._waiting = True
 
-    def _wait_for_obs(self):
-        results = [remote.recv() for remote in self._remotes]
+    def _wait_for_obs(self, from_shared_memory=None, env_ids=None):
+        if from_shared_memory is None:
+            from_shared_memory = self.use_shared_memory
+        all_envs = env_ids is None
+        if all_envs:
+            env_ids = list(range(self.nb_env))
+        results = [self._remotes[env_id].recv() for env_id in env_ids]
         self._waiting = False
-        obs, rews, dones, infos = zip(*results)
+        if from_shared_memory:
+            infos = tuple(results)
+            # the observations of all the environments are a view on the shared memory,
+            # otherwise a copy of the relevant rows is made
+            obs = self._shm_obs if all_envs else self._shm_obs[env_ids]
+            rews = self._shm_reward[env_ids]
+            dones = self._shm_done[env_ids]
+        else:
+            if results:
+                obs, rews, dones, infos = zip(*results)
+            else:
+                obs, rews, dones, infos = (), (), (), ()
+            obs = self._stack(obs) if not self.obs_as_class else obs
+            rews = self._stack(rews)
+            dones = self._stack(dones)
         if self.obs_as_class:
-            obs = [
-                self.envs[e].observation_space.from_vect(ob) for e, ob in enumerate(obs)
-            ]
-        return np.stack(obs), np.stack(rews), np.stack(dones), infos
+            obs = self._stack([
+                self.envs[env_id].observation_space.from_vect(ob)
+                for env_id, ob in zip(env_ids, obs)
+            ])
+        return obs, rews, dones, infos
+
+    @staticmethod
+    def _stack(obs):
+        # np.stack does not support empty sequences
+        if len(obs) == 0:
+            return np.array(obs)
+        return np.stack(obs)
+
+    def _check_actions(self, actions, nb_env):
+        if len(actions) != nb_env:
+            raise MultiEnvException(
+                "Incorrect number of actions provided. You provided {} actions, but the "
+                "MultiEnvironment counts {} different environment."
+                "".format(len(actions), nb_env)
+            )
+        for act in actions:
+            if not isinstance(act, BaseAction):
+                raise MultiEnvException(
+                    'All actions send to MultiEnvironment.step should be of type "grid2op.BaseAction"'
+                    "and not {}".format(type(act))
+                )
+
+    def _check_not_pending(self):
+        if self._pending:
+            raise MultiEnvException(
+                "Some sub environments (ids {}) are still performing a step (see `step_async`). "
+                "Retrieve their results with `step_wait` or `step_wait_first` "
+                "before using this function.".format(sorted(self._pending))
+            )
 
     def copy(self):
         raise NotImplementedError(
@@ -447,23 +639,150 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
-        if len(actions) != self.nb_env:
-            raise MultiEnvException(
-                "Incorrect number of actions provided. You provided {} actions, but the "
-                "MultiEnvironment counts {} different environment."
-                "".format(len(actions), self.nb_env)
-            )
-        for act in actions:
-            if not isinstance(act, BaseAction):
-                raise MultiEnvException(
-                    'All actions send to MultiEnvironment.step should be of type "grid2op.BaseAction"'
-                    "and not {}".format(type(act))
-                )
+        self._check_not_pending()
+        self._check_actions(actions, self.nb_env)
 
         self._send_act(actions)
         obs, rews, dones, infos = self._wait_for_obs()
         return obs, rews, dones, infos
 
+    def step_async(self, actions, env_ids=None):
+        """
+        .. versionadded:: 1.8.2
+
+        Send the actions to the underlying environments and return immediately, without waiting for
+        the results. These results are then retrieved with :func:`BaseMultiProcessEnvironment.step_wait`
+        (all the environments) or :func:`BaseMultiProcessEnvironment.step_wait_first` (the first environments
+        that are done with their step).
+
+        This allows for example to compute the next actions of some environments while the other ones are still
+        computing their step.
+
+        Parameters
+        ----------
+        actions: ``list``
+            List of :class:`grid2op.Action.BaseAction`, one per environment in `env_ids`.
+
+        env_ids: ``list``
+            Id of the sub environments that will perform a step (``None``, default: all of them). None of them
+            should be still performing a step.
+
+        Examples
+        ---------
+
+        .. code-block:: python
+
+            import grid2op
+            from grid2op.Environment import SingleEnvMultiProcess
+            env = grid2op.make("l2rpn_case14_sandbox")
+            multi_env = SingleEnvMultiProcess(env, nb_env=4)
+            obss = multi_env.reset()
+
+            # equivalent to `multi_env.step(actions)`
+            multi_env.step_async([env.action_space() for _ in range(multi_env.nb_env)])
+            # do something else here
+            obss, rewards, dones, infos = multi_env.step_wait()
+
+            # "first ready" mode: do not wait for the slowest environments
+            multi_env.step_async([env.action_space() for _ in range(multi_env.nb_env)])
+            for _ in range(10):
+                env_ids, obss, rewards, dones, infos = multi_env.step_wait_first(nb_env_ready=2)
+                # only the environments that are done with their step are stepped again
+                multi_env.step_async([env.action_space() for _ in env_ids], env_ids=env_ids)
+            obss, rewards, dones, infos = multi_env.step_wait()  # all the still pending environments
+
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot use it.")
+        if env_ids is None:
+            env_ids = list(range(self.nb_env))
+        else:
+            env_ids = [int(el) for el in env_ids]
+        if len(set(env_ids)) != len(env_ids):
+            raise MultiEnvException("The same environment cannot perform two steps at once.")
+        for env_id in env_ids:
+            if env_id < 0 or env_id >= self.nb_env:
+                raise MultiEnvException(
+                    "Unknown environment id {}, there are {} environments"
+                    "".format(env_id, self.nb_env)
+                )
+            if env_id in self._pending:
+                raise MultiEnvException(
+                    "Environment {} is still performing its step, retrieve its results "
+                    "(with `step_wait` or `step_wait_first`) before sending it a new action"
+                    "".format(env_id)
+                )
+        self._check_actions(actions, len(env_ids))
+        self._send_act(actions, env_ids)
+        self._pending += env_ids
+
+    def step_wait(self):
+        """
+        .. versionadded:: 1.8.2
+
+        Wait for all the environments that performs a step (see :func:`BaseMultiProcessEnvironment.step_async`)
+        and return their results, sorted by environment id.
+
+        If all environments were stepped with `step_async(actions)`, this is equivalent to `step(actions)`.
+
+        Returns
+        -------
+        The same outputs as :func:`BaseMultiProcessEnvironment.step` for the pending environments.
+
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot use it.")
+        env_ids = sorted(self._pending)
+        self._pending = []
+        if len(env_ids) == self.nb_env:
+            return self._wait_for_obs()
+        return self._wait_for_obs(env_ids=env_ids)
+
+    def step_wait_first(self, nb_env_ready=1, timeout=None):
+        """
+        .. versionadded:: 1.8.2
+
+        Wait until at least `nb_env_ready` environments have finished their step (see
+        :func:`BaseMultiProcessEnvironment.step_async`) and return the results of all the ones that are finished,
+        without waiting for the others. The other environments can then be retrieved by a later call
+        to this function or to :func:`BaseMultiProcessEnvironment.step_wait`.
+
+        Parameters
+        ----------
+        nb_env_ready: ``int``
+            Minimum number of environments to wait for (it is capped to the number of environments still performing
+            a step)
+
+        timeout: ``float``
+            Maximum time to wait (in seconds). If it expires, the results of environments that are finished are
+            returned, even if there are less than `nb_env_ready` of them (``None``, default: no timeout).
+
+        Returns
+        -------
+        env_ids: ``numpy.ndarray``
+            The id of the environments for which the results are returned (sorted)
+
+        obs, rews, dones, infos:
+            The same outputs as :func:`BaseMultiProcessEnvironment.step` but only for the environments in `env_ids`
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot use it.")
+        nb_env_ready = min(int(nb_env_ready), len(self._pending))
+        conn_to_id = {self._remotes[env_id]: env_id for env_id in self._pending}
+        ready = set()
+        beg_ = time.perf_counter()
+        remaining = timeout
+        while len(ready) < nb_env_ready:
+            ready.update(wait([el for el in conn_to_id if el not in ready], remaining))
+            if timeout is not None:
+                remaining = timeout - (time.perf_counter() - beg_)
+                if remaining <= 0.0:
+                    break
+        env_ids = sorted(conn_to_id[el] for el in ready)
+        self._pending = [el for el in self._pending if el not in env_ids]
+        obs, rews, dones, infos = self._wait_for_obs(env_ids=env_ids)
+        return np.array(env_ids, dtype=dt_int), obs, rews, dones, infos
+
     def reset(self):
         """
         Reset all the environments, and return all the associated observation.
@@ -481,9 +800,20 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
-        for remote in self._remotes:
-            remote.send(("r", None))
-        res = [remote.recv() for e, remote in enumerate(self._remotes)]
+        self._check_not_pending()
+        if self.use_shared_memory:
+            for remote in self._remotes:
+                remote.send(("rs", None))
+            for remote in self._remotes:
+                remote.recv()
+            res = self._shm_obs
+            if not self.obs_as_class:
+                # view on the shared memory, no copy
+                return res
+        else:
+            for remote in self._remotes:
+                remote.send(("r", None))
+            res = [remote.recv() for e, remote in enumerate(self._remotes)]
         if self.obs_as_class:
             res = [
                 self.envs[e].observation_space.from_vect(el) for e, el in enumerate(res)
@@ -648,8 +978,11 @@ class BaseMultiProcessEnvironment(GridObjects):
                     '"grid2op.BaseAction" and not {}'.format(type(act))
                 )
 
+        self._check_not_pending()
         self._send_sim(actions)
-        sim_obs, sim_rews, sim_dones, sim_infos = self._wait_for_obs()
+        sim_obs, sim_rews, sim_dones, sim_infos = self._wait_for_obs(
+            from_shared_memory=False
+        )
         return sim_obs, sim_rews, sim_dones, sim_infos
 
     def __getattr__(self, name):
@@ -57,7 +57,13 @@ class MultiEnvMultiProcess(BaseMultiProcessEnvironment):
 
     """
 
-    def __init__(self, envs, nb_envs, obs_as_class=True, return_info=True, logger=None):
+    def __init__(self,
+                 envs,
+                 nb_envs,
+                 obs_as_class=True,
+                 return_info=True,
+                 logger=None,
+                 use_shared_memory=False):
         try:
             nb_envs = np.array(nb_envs)
             nb_envs = nb_envs.astype(dt_int)
@@ -92,6 +98,7 @@ class MultiEnvMultiProcess(BaseMultiProcessEnvironment):
             logger=logger.getChild("MultiEnvMultiProcess")
             if logger is not None
             else None,
+            use_shared_memory=use_shared_memory,
         )
 
 
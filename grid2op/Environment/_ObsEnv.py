@@ -47,6 +47,58 @@ class _ObsEnv(BaseEnv):
     This class is reserved for internal use. Do not attempt to do anything with it.
     """
 
+    # all the attributes modified by `update_grid`
+    _attr_init_state = [
+        "_load_p",
+        "_load_q",
+        "_load_v",
+        "_prod_p",
+        "_prod_q",
+        "_prod_v",
+        "_topo_vect",
+        "_line_status_orig",
+        "_thermal_limit_a",
+        "gen_activeprod_t_init",
+        "gen_activeprod_t_redisp_init",
+        "times_before_line_status_actionable_init",
+        "times_before_topology_actionable_init",
+        "time_next_maintenance_init",
+        "duration_next_maintenance_init",
+        "target_dispatch_init",
+        "actual_dispatch_init",
+        "_already_modified_gen_init",
+        "opp_space_state",
+        "opp_state",
+        "_storage_current_charge_init",
+        "_storage_previous_charge_init",
+        "_action_storage_init",
+        "_amount_storage_init",
+        "_amount_storage_prev_init",
+        "_storage_power_init",
+        "_limit_curtailment_init",
+        "_gen_before_curtailment_init",
+        "_sum_curtailment_mw_init",
+        "_sum_curtailment_mw_prev_init",
+        "delta_time_seconds",
+        "_nb_time_step_init",
+        "_attention_budget_state_init",
+        "_backend_snapshot_init",
+    ]
+
+    # all the attributes set by `init` (and not by `_reset_to_orig_state`) that are modified by `step`
+    _attr_after_init = [
+        "_gen_activeprod_t",
+        "_gen_activeprod_t_redisp",
+        "_times_before_line_status_actionable",
+        "_times_before_topology_actionable",
+        "_time_next_maintenance",
+        "_duration_next_maintenance",
+        "_target_dispatch",
+        "_actual_dispatch",
+        "_already_modified_gen",
+        "_timestep_overflow",
+    ]
+
     def __init__(
         self,
         init_env_path,
@@ -206,6 +258,16 @@ class _ObsEnv(BaseEnv):
             
         self._max_episode_duration = max_episode_duration
 
+        # do not build the observation after each step (used in `simulate_batch`)
+        self._skip_obs = False
+        self._vect_after_init = {}
+
+        # state of the backend of the real environment (see `Backend.snapshot`)
+        self._backend_snapshot_init = None
+
+        # pool of processes used to simulate in parallel (see `ObservationSpace.start_simulate_pool`)
+        self._simulate_pool = None
+
     def max_episode_duration(self):
         return self._max_episode_duration
 
@@ -305,9 +367,12 @@ class _ObsEnv(BaseEnv):
                            "environment that cannot be copied.")
         backend = self.backend
         self.backend = None
+        simulate_pool = self._simulate_pool
+        self._simulate_pool = None  # processes are not copied
         res = copy.deepcopy(self)
         res.backend = backend.copy()
         self.backend = backend
+        self._simulate_pool = simulate_pool
         return res
 
     def init(
@@ -396,6 +461,12 @@ class _ObsEnv(BaseEnv):
         self.time_stamp = time_stamp
         self._timestep_overflow[:] = timestep_overflow
 
+        # save the state, to be able to simulate multiple actions (see `simulate_batch`)
+        self._vect_after_init = {
+            attr_nm: copy.deepcopy(getattr(self, attr_nm))
+            for attr_nm in self._attr_after_init
+        }
+
     def _get_new_prod_setpoint(self, action):
         new_p = 1.0 * self._backend_action_set.prod_p.values
         if "prod_p" in action._dict_inj:
@@ -479,6 +550,9 @@ class _ObsEnv(BaseEnv):
         reset this "environment" to the state it should be
         """
         self.reset()  # reset the "BaseEnv"
+        if self._backend_snapshot_init is not None:
+            # all simulations start from the same state of the backend
+            self.backend.restore(self._backend_snapshot_init)
         self.backend.set_thermal_limit(self._thermal_limit_a)
         self._backend_action_set.all_changed()
         self._backend_action = copy.deepcopy(self._backend_action_set)
@@ -555,15 +629,86 @@ class _ObsEnv(BaseEnv):
         if self.__unusable:
             raise EnvError("Impossible to use a Observation backend with an "
                            "environment that cannot be copied.")
-        self._ptr_orig_obs_space.simulate_called()
-        maybe_exc = self._ptr_orig_obs_space.can_use_simulate()
-        if maybe_exc is not None:
-            raise maybe_exc
+        self._count_simulate_called()
         self._reset_to_orig_state()
         
         obs, reward, done, info = self.step(action)
         return obs, reward, done, info
 
+    def _count_simulate_called(self):
+        """tells the observation space that "simulate" is used and raise the
+        appropriate error if it has been used too much"""
+        self._ptr_orig_obs_space.simulate_called()
+        maybe_exc = self._ptr_orig_obs_space.can_use_simulate()
+        if maybe_exc is not None:
+            raise maybe_exc
+
+    def simulate_batch(self, actions, build_obs=True, _count_simulate=True):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+            Prefer using `obs.simulate_batch(actions)`
+
+        Simulate all the actions in `actions` on the same "forecasted" powergrid (the one
+        set up by the last call to :func:`_ObsEnv.init`).
+
+        The state of this "environment" is reset before each action, the forecast state
+        is only prepared once.
+
+        Parameters
+        ----------
+        actions: ``list``
+            The list of actions to simulate
+
+        build_obs: ``bool``
+            Whether to build the observation after each step
+
+        _count_simulate: ``bool``
+            Whether to count the simulations in the observation space (``False`` only for the
+            processes of a :class:`grid2op.Environment._ObsEnvPool._ObsEnvPool`, the counting being done
+            in the main process)
+
+        Returns
+        -------
+        rho: ``numpy.ndarray``
+            Relative flows for each action (2d array)
+
+        reward: ``numpy.ndarray``
+            Reward for each action
+
+        done: ``numpy.ndarray``
+            Whether each simulation is a game over
+
+        has_exception: ``numpy.ndarray``
+            Whether an exception has been raised for each action
+
+        """
+        if self.__unusable:
+            raise EnvError("Impossible to use a Observation backend with an "
+                           "environment that cannot be copied.")
+        nb_act = len(actions)
+        rho = np.zeros((nb_act, self.n_line), dtype=dt_float)
+        reward = np.zeros(nb_act, dtype=dt_float)
+        done = np.zeros(nb_act, dtype=dt_bool)
+        has_exception = np.zeros(nb_act, dtype=dt_bool)
+
+        self._skip_obs = not build_obs
+        try:
+            for act_id, action in enumerate(actions):
+                if _count_simulate:
+                    self._count_simulate_called()
+                self._reset_to_orig_state()
+                for attr_nm, attr_val in self._vect_after_init.items():
+                    getattr(self, attr_nm)[:] = attr_val
+                _, reward[act_id], done[act_id], info = self.step(action)
+                has_exception[act_id] = len(info["exception"]) > 0
+                if not done[act_id]:
+                    rho[act_id, :] = self.backend.get_relative_flow()
+        finally:
+            self._skip_obs = False
+        return rho, reward, done, has_exception
+
     def get_obs(self, _update_state=True):
         """
         INTERNAL
@@ -580,6 +725,9 @@ class _ObsEnv(BaseEnv):
         if self.__unusable:
             raise EnvError("Impossible to use a Observation backend with an "
                            "environment that cannot be copied.")
+        if self._skip_obs:
+            # observation is not used (see `simulate_batch`)
+            return self.current_obs
         if _update_state:
             self.current_obs.update(self, with_forecast=False)
         res = self.current_obs.copy()
@@ -665,6 +813,53 @@ class _ObsEnv(BaseEnv):
         if self._has_attention_budget:
             self._attention_budget_state_init = env._attention_budget.get_state()
 
+        # state of the backend (used to start all simulations from the results of the real powergrid)
+        if (
+            self.backend is not None
+            and self.backend.can_snapshot
+            and type(real_backend) is type(self.backend)
+        ):
+            self._backend_snapshot_init = real_backend.snapshot()
+
+    def _get_init_state(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Get a copy of the state set by the last call to :func:`_ObsEnv.update_grid` (the state
+        from which every simulation starts) so that it can be sent to another process.
+
+        Returns
+        -------
+        res: ``dict``
+            The state, see :func:`_ObsEnv._set_init_state`
+        """
+        res = {}
+        for attr_nm in self._attr_init_state:
+            tmp = getattr(self, attr_nm)
+            if isinstance(tmp, np.ndarray):
+                tmp = tmp.copy()
+            res[attr_nm] = tmp
+        return res
+
+    def _set_init_state(self, state):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Has the same effect as :func:`_ObsEnv.update_grid` but from a state retrieved with
+        :func:`_ObsEnv._get_init_state` (possibly in another process) instead of an environment.
+        """
+        for attr_nm, attr_val in state.items():
+            tmp = getattr(self, attr_nm)
+            if isinstance(tmp, np.ndarray) and tmp.shape == np.shape(attr_val):
+                tmp[:] = attr_val
+            else:
+                setattr(self, attr_nm, attr_val)
+        self.is_init = False
+
     def get_current_line_status(self):
         if self.__unusable:
             raise EnvError("Impossible to use a Observation backend with an "
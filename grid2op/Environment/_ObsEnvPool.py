@@ -0,0 +1,201 @@
+# Copyright (c) 2019-2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+from multiprocessing import Process, Pipe
+import numpy as np
+
+from grid2op.Exceptions import EnvError
+
+
+class _RemoteObsEnv(Process):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    This class represents a "simulation environment" (:class:`grid2op.Environment._ObsEnv`) that lives
+    in another process. It holds its own copy of the backend.
+
+    Its state is updated, before each batch of simulations, from a state sent by the main process
+    (see :func:`grid2op.Environment._ObsEnv._get_init_state`)
+    """
+
+    def __init__(self, obs_env, remote, parent_remote, name=None):
+        Process.__init__(self, group=None, target=None, name=name)
+        self.obs_env = obs_env
+        self.remote = remote
+        self.parent_remote = parent_remote
+
+    def run(self):
+        self.parent_remote.close()
+        while True:
+            cmd, data = self.remote.recv()
+            if cmd == "sim":
+                state, init_kwargs, actions, build_obs = data
+                try:
+                    self.obs_env._set_init_state(state)
+                    self.obs_env.init(**init_kwargs)
+                    res = self.obs_env.simulate_batch(
+                        actions, build_obs=build_obs, _count_simulate=False
+                    )
+                except Exception as exc_:
+                    # exception is raised in the main process
+                    res = exc_
+                self.remote.send(res)
+            elif cmd == "params":
+                self.obs_env.change_parameters(data)
+            elif cmd == "reward":
+                self.obs_env._reward_helper.change_reward(data)
+            elif cmd == "other_rewards":
+                self.obs_env.other_rewards = data
+            elif cmd == "c":
+                # close everything
+                self.obs_env.close()
+                self.remote.close()
+                break
+            else:
+                raise NotImplementedError
+
+
+class _ObsEnvPool(object):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+        Prefer using `env.observation_space.start_simulate_pool(nb_process)`
+
+    A pool of persistent processes, each holding a copy of the :class:`grid2op.Environment._ObsEnv`
+    (and thus of its backend) used to perform the simulations of
+    :func:`grid2op.Observation.BaseObservation.simulate_batch` in parallel.
+
+    The actions are split in `nb_process` contiguous chunks, each chunk is simulated in one process
+    and the results are gathered in the order in which the actions were given. As each simulation starts
+    from the same state (the one of the observation), the results are the same as the ones obtained
+    without the pool.
+
+    """
+
+    def __init__(self, obs_env, nb_process):
+        try:
+            nb_process = int(nb_process)
+        except Exception as exc_:
+            raise EnvError(
+                f"Impossible to convert the number of process to an int with error {exc_}"
+            ) from exc_
+        if nb_process <= 0:
+            raise EnvError("You need at least one process to build a simulation pool.")
+        self.nb_process = nb_process
+        self.__closed = False
+
+        self._remotes = []
+        self._ps = []
+        for p_id in range(self.nb_process):
+            remote, work_remote = Pipe()
+            obs_env_cpy = obs_env.copy()
+            # counting the number of calls to simulate is done in the main process
+            obs_env_cpy._ptr_orig_obs_space = None
+            p_ = _RemoteObsEnv(
+                obs_env_cpy,
+                remote=work_remote,
+                parent_remote=remote,
+                name=f"{type(obs_env).__name__}_{p_id}",
+            )
+            p_.daemon = True  # if the main process crashes, we should not cause things to hang
+            p_.start()
+            work_remote.close()
+            self._remotes.append(remote)
+            self._ps.append(p_)
+
+    def simulate_batch(self, obs_env, actions, init_kwargs, build_obs=True):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Performs the simulations of all the `actions` on the processes of the pool.
+
+        Parameters
+        ----------
+        obs_env: :class:`grid2op.Environment._ObsEnv`
+            The "simulation environment" of the main process, used to retrieve the initial state
+
+        actions: ``list``
+            The actions to simulate
+
+        init_kwargs: ``dict``
+            The key word arguments passed to :func:`grid2op.Environment._ObsEnv.init`
+
+        build_obs: ``bool``
+            See :func:`grid2op.Observation.BaseObservation.simulate_batch`
+
+        Returns
+        -------
+        Same as :func:`grid2op.Environment._ObsEnv.simulate_batch`
+
+        """
+        if self.__closed:
+            raise EnvError("This simulation pool is closed, you cannot use it.")
+        for _ in actions:
+            obs_env._count_simulate_called()
+
+        state = obs_env._get_init_state()
+        used_remotes = []
+        for remote, chunk in zip(
+            self._remotes, np.array_split(np.arange(len(actions)), self.nb_process)
+        ):
+            if chunk.shape[0] == 0:
+                continue
+            remote.send(
+                ("sim", (state, init_kwargs, [actions[el] for el in chunk], build_obs))
+            )
+            used_remotes.append(remote)
+
+        results = [remote.recv() for remote in used_remotes]
+        for res in results:
+            if isinstance(res, Exception):
+                raise res
+        if not results:
+            return obs_env.simulate_batch([], _count_simulate=False)
+        rho, reward, done, has_exception = zip(*results)
+        return (
+            np.concatenate(rho),
+            np.concatenate(reward),
+            np.concatenate(done),
+            np.concatenate(has_exception),
+        )
+
+    def _send_all(self, cmd, data):
+        if self.__closed:
+            raise EnvError("This simulation pool is closed, you cannot use it.")
+        for remote in self._remotes:
+            remote.send((cmd, data))
+
+    def change_parameters(self, new_param):
+        """change the parameters used by all the processes"""
+        self._send_all("params", new_param)
+
+    def change_reward(self, reward_func):
+        """change the reward used by all the processes"""
+        self._send_all("reward", reward_func)
+
+    def change_other_rewards(self, other_rewards):
+        """change the "other_rewards" used by all the processes"""
+        self._send_all("other_rewards", other_rewards)
+
+    def close(self):
+        """
+        Close all the processes.
+        """
+        if self.__closed:
+            return
+        for remote in self._remotes:
+            remote.send(("c", None))
+        for p_ in self._ps:
+            p_.join()
+        for remote in self._remotes:
+            remote.close()
+        self.__closed = True
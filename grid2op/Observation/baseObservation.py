@@ -2275,6 +2275,97 @@ class BaseObservation(GridObjects):
             # `simulated_info` gives extra information on this forecast state
 
         """
+        self._aux_init_obs_env_simulate(time_step)
+        sim_obs, *rest = self._obs_env.simulate(action)
+        sim_obs = copy.deepcopy(sim_obs)
+        return (sim_obs, *rest)  # parentheses are needed for python 3.6 at least.
+
+    def simulate_batch(self, actions, time_step=1, build_obs=True):
+        """
+        This method allows to simulate the effect of many actions on the same forecast powergrid state
+        in one single call.
+
+        It is equivalent to calling :func:`BaseObservation.simulate` once for each action in `actions` but:
+
+        - the forecast state is prepared only once and then reused for every candidate action
+        - it does not return one observation per action but stacked numpy arrays
+        - if `build_obs` is ``False`` no observation is built after each simulation which can lead to
+          non negligible speed-ups.
+
+        Each simulated action still counts as a call to "simulate" (see
+        :attr:`grid2op.Parameters.Parameters.MAX_SIMULATE_PER_STEP` for example).
+
+        If a pool of processes has been started with
+        :func:`grid2op.Observation.ObservationSpace.start_simulate_pool` the actions are simulated
+        in parallel on these processes (the results are the same).
+
+        .. versionadded:: 1.8.2
+
+        Parameters
+        ----------
+        actions: ``list``
+            The list of actions (:class:`grid2op.Action.BaseAction`) to simulate
+
+        time_step: ``int``
+            The time step of the forecasted grid to perform the actions on. If no forecast are available for this
+            time step, a :class:`grid2op.Exceptions.NoForecastAvailable` is thrown.
+
+        build_obs: ``bool``
+            Whether to build (internally) the observation after each simulation (``True``, default) or not.
+
+            .. warning::
+                If set to ``False``, rewards that read the observation of the environment (*eg*
+                :class:`grid2op.Reward.CloseToOverflowReward` or :class:`grid2op.Reward.LinesCapacityReward`)
+                will not be computed on the simulated state.
+
+        Returns
+        -------
+        rho: ``numpy.ndarray``
+            The relative flows (see :attr:`BaseObservation.rho`) on each powerline for each simulated action,
+            shape (`len(actions)`, `n_line`). It is 0. if the simulation led to a game over.
+
+        reward: ``numpy.ndarray``
+            The reward obtained for each action, shape (`len(actions)`, )
+
+        done: ``numpy.ndarray``
+            Whether each simulation ended up in a "game over", shape (`len(actions)`, )
+
+        has_exception: ``numpy.ndarray``
+            Whether at least one exception has been raised (see the "exception" key of the `info` returned by
+            :func:`BaseObservation.simulate`) for each action, shape (`len(actions)`, )
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import numpy as np
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            obs = env.reset()
+
+            all_actions = env.action_space.get_all_unitary_topologies_set(env.action_space)
+            rho, reward, done, has_exception = obs.simulate_batch(all_actions, build_obs=False)
+            best_action = all_actions[np.argmax(reward)]
+
+        """
+        init_kwargs = self._aux_get_obs_env_init_kwargs(time_step)
+        if self._obs_env._simulate_pool is not None:
+            return self._obs_env._simulate_pool.simulate_batch(
+                self._obs_env, actions, init_kwargs, build_obs=build_obs
+            )
+        self._obs_env.init(**init_kwargs)
+        return self._obs_env.simulate_batch(actions, build_obs=build_obs)
+
+    def _aux_init_obs_env_simulate(self, time_step):
+        """initialize the "_obs_env" with the forecast for `time_step`, raises
+        the appropriate errors if this is not possible"""
+        self._obs_env.init(**self._aux_get_obs_env_init_kwargs(time_step))
+
+    def _aux_get_obs_env_init_kwargs(self, time_step):
+        """get the arguments to pass to `_obs_env.init` to simulate on the forecast
+        of `time_step`, raises the appropriate errors if this is not possible"""
         if self.action_helper is None:
             raise NoForecastAvailable(
                 "No forecasts are available for this instance of BaseObservation "
@@ -2309,17 +2400,13 @@ class BaseObservation(GridObjects):
 
         timestamp = self._forecasted_grid_act[time_step]["timestamp"]
         inj_action = self._forecasted_grid_act[time_step]["inj_action"]
-        self._obs_env.init(
-            inj_action,
-            time_stamp=timestamp,
-            timestep_overflow=self.timestep_overflow,
-            topo_vect=self.topo_vect,
-            time_step=time_step,
-        )
-
-        sim_obs, *rest = self._obs_env.simulate(action)
-        sim_obs = copy.deepcopy(sim_obs)
-        return (sim_obs, *rest)  # parentheses are needed for python 3.6 at least.
+        return {
+            "new_state_action": inj_action,
+            "time_stamp": timestamp,
+            "timestep_overflow": self.timestep_overflow,
+            "topo_vect": self.topo_vect,
+            "time_step": time_step,
+        }
 
     def copy(self):
         """
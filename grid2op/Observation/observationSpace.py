@@ -174,6 +174,61 @@ class ObservationSpace(SerializableObservationSpace):
         self.logger.warn("Forecasts have been deactivated because "
                          "the backend cannot be copied.")
         
+    def start_simulate_pool(self, nb_process):
+        """
+        Start a pool of `nb_process` persistent processes, each holding its own copy of the backend used
+        for the simulations. Once started, the calls to :func:`grid2op.Observation.BaseObservation.simulate_batch`
+        are split among these processes and performed in parallel.
+
+        The pool is closed with :func:`ObservationSpace.close_simulate_pool` or when the environment is closed.
+
+        .. versionadded:: 1.8.2
+
+        Parameters
+        ----------
+        nb_process: ``int``
+            Number of processes in the pool
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            env.observation_space.start_simulate_pool(4)
+
+            obs = env.reset()
+            all_actions = env.action_space.get_all_unitary_topologies_set(env.action_space)
+            # actions are simulated on 4 different processes
+            rho, reward, done, has_exception = obs.simulate_batch(all_actions)
+
+            env.observation_space.close_simulate_pool()
+
+        """
+        from grid2op.Environment._ObsEnvPool import _ObsEnvPool
+
+        if not self.obs_env.is_valid():
+            raise EnvError("Impossible to start a simulation pool "
+                           "when you cannot simulate (because the "
+                           "backend could not be copied)")
+        self.close_simulate_pool()
+        self.obs_env._simulate_pool = _ObsEnvPool(self.obs_env, nb_process)
+
+    def close_simulate_pool(self):
+        """
+        Close the pool of processes started with :func:`ObservationSpace.start_simulate_pool` (if any).
+        Simulations are then performed in the main process.
+
+        .. versionadded:: 1.8.2
+
+        """
+        if self.obs_env is None or self.obs_env._simulate_pool is None:
+            return
+        self.obs_env._simulate_pool.close()
+        self.obs_env._simulate_pool = None
+
     def simulate_called(self):
         """
         INTERNAL
@@ -213,6 +268,8 @@ class ObservationSpace(SerializableObservationSpace):
         """
         self.obs_env.change_parameters(new_param)
         self._simulate_parameters = new_param
+        if self.obs_env._simulate_pool is not None:
+            self.obs_env._simulate_pool.change_parameters(new_param)
 
     def change_other_rewards(self, dict_reward):
         """
@@ -261,10 +318,14 @@ class ObservationSpace(SerializableObservationSpace):
 
         for k, v in self.obs_env.other_rewards.items():
             v.initialize(self.obs_env)
+        if self.obs_env._simulate_pool is not None:
+            self.obs_env._simulate_pool.change_other_rewards(self.obs_env.other_rewards)
 
     def change_reward(self, reward_func):
         if self.obs_env.is_valid():
             self.obs_env._reward_helper.change_reward(reward_func)
+            if self.obs_env._simulate_pool is not None:
+                self.obs_env._simulate_pool.change_reward(reward_func)
         else:
             raise EnvError("Impossible to change the reward of the simulate "
                            "function when you cannot simulate (because the "
@@ -393,6 +454,7 @@ class ObservationSpace(SerializableObservationSpace):
         return res
 
     def close(self):
+        self.close_simulate_pool()
         if self.obs_env is not None:
             self.obs_env.close()
 
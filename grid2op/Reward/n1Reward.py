@@ -59,35 +59,55 @@ class N1Reward(BaseReward):
     def __init__(self, l_id=0, logger=None):
         BaseReward.__init__(self, logger=logger)
         self.backend = None
+        self.backend_action = None
         self.l_id = l_id
 
     def initialize(self, env):
-        self.backend = env.backend.copy()
-        bk_act_cls = _BackendAction.init_grid(env.backend)
-        self.backend_action = bk_act_cls()
+        if env.backend.can_snapshot:
+            # the backend of the environment is used, and put back in its original
+            # state after the computation (see `__call__`)
+            self.backend = None
+        else:
+            self.backend = env.backend.copy()
+            bk_act_cls = _BackendAction.init_grid(env.backend)
+            self.backend_action = bk_act_cls()
 
     def __call__(self, action, env, has_error, is_done, is_illegal, is_ambiguous):
         if is_done:
             return self.reward_min
-        act = env.backend.get_action_to_set()
         th_lim = env.get_thermal_limit()
         th_lim[th_lim <= 1] = 1  # assign 1 for the thermal limit
 
-        this_n1 = copy.deepcopy(act)
-        self.backend_action += this_n1
-        self.backend.apply_action(self.backend_action)
-        self.backend._disconnect_line(self.l_id)
-        try:
-            # TODO there is a bug in lightsimbackend that make it crash instead of diverging
-            conv = self.backend.runpf()
-        except Exception as exc_:
-            conv = False
+        if self.backend is None:
+            # the backend of the environment is already in the right state
+            backend = env.backend
+            snapshot = backend.snapshot()
+        else:
+            backend = self.backend
+            snapshot = None
+            act = env.backend.get_action_to_set()
+            this_n1 = copy.deepcopy(act)
+            self.backend_action += this_n1
+            backend.apply_action(self.backend_action)
 
-        if conv:
-            flow = self.backend.get_line_flow()
-        return (flow / th_lim).max()
+        try:
+            backend._disconnect_line(self.l_id)
+            try:
+                # TODO there is a bug in lightsimbackend that make it crash instead of diverging
+                conv = backend.runpf()
+            except Exception as exc_:
+                conv = False
+
+            if conv:
+                flow = backend.get_line_flow()
+            res = (flow / th_lim).max()
+        finally:
+            if snapshot is not None:
+                backend.restore(snapshot)
+        return res
 
     def close(self):
-        self.backend.close()
+        if self.backend is not None:
+            self.backend.close()
         del self.backend
         self.backend = None
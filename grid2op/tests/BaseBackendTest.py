@@ -434,6 +434,61 @@ class BaseTestLoadingBackendFunc(MakeBackend):
         assert np.sum(~vect_) == 1
         assert not vect_[3]
 
+    def test_disconnect_lines(self):
+        self.skip_if_needed()
+        lines_id = np.array([3, 8, self.backend.n_line - 1])
+        backend_cpy = self.backend.copy()
+        self.backend._disconnect_lines(lines_id)
+        for l_id in lines_id:
+            backend_cpy._disconnect_line(l_id)
+        assert np.all(self.backend.get_line_status() == backend_cpy.get_line_status())
+        assert np.sum(~self.backend.get_line_status()) == lines_id.shape[0]
+        assert np.all(self.backend.get_topo_vect() == backend_cpy.get_topo_vect())
+
+        conv = self.backend.runpf(is_dc=False)
+        conv2 = backend_cpy.runpf(is_dc=False)
+        assert conv == conv2
+        p_or, *_ = self.backend.lines_or_info()
+        p_or_ref, *_ = backend_cpy.lines_or_info()
+        assert self.compare_vect(p_or, p_or_ref)
+
+    def test_snapshot_restore(self):
+        self.skip_if_needed()
+        if not self.backend.can_snapshot:
+            self.skipTest("This backend does not support snapshot / restore")
+        self.backend.runpf(is_dc=False)
+        p_or_init, q_or_init, v_or_init, a_or_init = self.backend.lines_or_info()
+        topo_init = 1 * self.backend.get_topo_vect()
+        snap = self.backend.snapshot()
+
+        self.backend._disconnect_line(3)
+        self.backend.runpf(is_dc=False)
+        p_or_disc, *_ = self.backend.lines_or_info()
+        assert not self.backend.get_line_status()[3]
+
+        self.backend.restore(snap)
+        assert self.backend.get_line_status()[3]
+        assert np.all(self.backend.get_topo_vect() == topo_init)
+        p_or, q_or, v_or, a_or = self.backend.lines_or_info()
+        assert self.compare_vect(p_or, p_or_init)
+        assert self.compare_vect(a_or, a_or_init)
+        # the powerflow gives the same results as before the disconnection
+        self.backend.runpf(is_dc=False)
+        p_or, q_or, v_or, a_or = self.backend.lines_or_info()
+        assert self.compare_vect(p_or, p_or_init)
+        assert self.compare_vect(v_or, v_or_init)
+
+        # snapshot can be restored in another backend
+        backend_cpy = self.backend.copy()
+        self.backend._disconnect_line(3)
+        self.backend.runpf(is_dc=False)
+        snap_disc = self.backend.snapshot()
+        backend_cpy.restore(snap_disc)
+        assert not backend_cpy.get_line_status()[3]
+        backend_cpy.runpf(is_dc=False)
+        p_or_cpy, *_ = backend_cpy.lines_or_info()
+        assert self.compare_vect(p_or_cpy, p_or_disc)
+
     def test_get_line_flow(self):
         self.skip_if_needed()
         self.backend.runpf(is_dc=False)
@@ -1639,6 +1694,12 @@ class BaseTestEnvPerformsCorrectCascadingFailures(MakeBackend):
         assert conv_ is None
         assert len(infos) == 1  # check that i have only one overflow
         assert np.sum(disco >= 0) == 1
+        # check the information stored for the cascading failure
+        assert not infos[0]["line_status"][self.id_first_line_disco]
+        assert np.sum(~infos[0]["line_status"]) == 1
+        assert np.abs(infos[0]["p_or"][self.id_first_line_disco]) <= self.tol_one
+        p_or, *_ = self.backend.lines_or_info()
+        assert self.compare_vect(infos[0]["p_or"], p_or)
 
     def test_next_grid_state_1overflow_envNoCF(self):
         # third i test that, if a line is on hard overflow, but i'm on a "no cascading failure" mode,
@@ -1854,9 +1915,9 @@ class BaseTestEnvPerformsCorrectCascadingFailures(MakeBackend):
         assert disco[self.id_2nd_line_disco] >= 0
         assert np.sum(disco >= 0) == 2
         for i, grid_tmp in enumerate(infos):
-            assert not grid_tmp.get_line_status()[self.id_first_line_disco]
+            assert not grid_tmp["line_status"][self.id_first_line_disco]
             if i == 1:
-                assert not grid_tmp.get_line_status()[self.id_2nd_line_disco]
+                assert not grid_tmp["line_status"][self.id_2nd_line_disco]
 
 
 class BaseTestChangeBusAffectRightBus(MakeBackend):
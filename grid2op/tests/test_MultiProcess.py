@@ -14,6 +14,7 @@ from grid2op.Environment import BaseMultiProcessEnvironment
 from grid2op.Environment import SingleEnvMultiProcess
 from grid2op.Environment import MultiEnvMultiProcess
 from grid2op.MakeEnv import make
+from grid2op.Exceptions import MultiEnvException
 from grid2op.Observation import CompleteObservation
 import pdb
 
@@ -81,6 +82,104 @@ class TestBaseMultiProcessEnvironment(unittest.TestCase):
         env1.close()
         env2.close()
 
+    def test_shared_memory(self):
+        nb_env = 2
+        nb_step = 3
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with make("rte_case5_example", test=True) as env:
+                envs = [env for _ in range(nb_env)]
+                res = {}
+                for use_shm in [False, True]:
+                    env.seed(2)
+                    multi_envs = BaseMultiProcessEnvironment(
+                        envs, obs_as_class=False, use_shared_memory=use_shm
+                    )
+                    all_obs = [1.0 * multi_envs.reset()]
+                    all_rewards = []
+                    for _ in range(nb_step):
+                        obss, rewards, dones, infos = multi_envs.step(
+                            [env.action_space() for _ in range(multi_envs.nb_env)]
+                        )
+                        assert obss.shape == (nb_env, env.observation_space.size())
+                        assert len(infos) == nb_env
+                        all_obs.append(1.0 * obss)
+                        all_rewards.append(rewards)
+                    multi_envs.close()
+                    res[use_shm] = (np.stack(all_obs), np.stack(all_rewards))
+                assert np.allclose(res[False][0], res[True][0])
+                assert np.allclose(res[False][1], res[True][1])
+
+                # with observation as class
+                env.seed(2)
+                multi_envs = BaseMultiProcessEnvironment(envs, use_shared_memory=True)
+                obss = multi_envs.reset()
+                for ob in obss:
+                    assert isinstance(ob, CompleteObservation)
+                obss, rewards, dones, infos = multi_envs.step(
+                    [env.action_space() for _ in range(multi_envs.nb_env)]
+                )
+                for ob in obss:
+                    assert isinstance(ob, CompleteObservation)
+                multi_envs.close()
+
+    def test_step_async(self):
+        nb_env = 3
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with make("rte_case5_example", test=True) as env:
+                envs = [env for _ in range(nb_env)]
+                res = {}
+                for use_shm in [False, True]:
+                    env.seed(2)
+                    multi_envs = BaseMultiProcessEnvironment(
+                        envs, obs_as_class=False, use_shared_memory=use_shm
+                    )
+                    multi_envs.reset()
+                    obss, rewards, dones, infos = multi_envs.step(
+                        [env.action_space() for _ in range(nb_env)]
+                    )
+                    res[use_shm] = 1.0 * obss
+                    multi_envs.close()
+
+                    env.seed(2)
+                    multi_envs = BaseMultiProcessEnvironment(
+                        envs, obs_as_class=False, use_shared_memory=use_shm
+                    )
+                    multi_envs.reset()
+                    multi_envs.step_async([env.action_space() for _ in range(nb_env)])
+                    # cannot step or reset while some environments are pending
+                    with self.assertRaises(MultiEnvException):
+                        multi_envs.step([env.action_space() for _ in range(nb_env)])
+                    with self.assertRaises(MultiEnvException):
+                        multi_envs.step_async([env.action_space()], env_ids=[0])
+                    obss_async, rewards_async, dones_async, infos_async = multi_envs.step_wait()
+                    assert np.allclose(obss_async, res[use_shm])
+                    assert np.allclose(rewards_async, rewards)
+                    assert np.all(dones_async == dones)
+                    assert len(infos_async) == nb_env
+
+                    # first ready mode
+                    multi_envs.step_async([env.action_space() for _ in range(nb_env)])
+                    env_ids, obss, rewards, dones, infos = multi_envs.step_wait_first(
+                        nb_env_ready=1
+                    )
+                    assert len(env_ids) >= 1
+                    assert obss.shape == (len(env_ids), env.observation_space.size())
+                    assert rewards.shape == (len(env_ids),)
+                    assert len(infos) == len(env_ids)
+                    # the ready environments can be stepped again
+                    multi_envs.step_async(
+                        [env.action_space() for _ in env_ids], env_ids=env_ids
+                    )
+                    obss, rewards, dones, infos = multi_envs.step_wait()
+                    assert obss.shape == (nb_env, env.observation_space.size())
+                    # nothing pending anymore
+                    env_ids, *_ = multi_envs.step_wait_first()
+                    assert len(env_ids) == 0
+                    multi_envs.reset()
+                    multi_envs.close()
+
 
 class TestSingleEnvMultiProcess(unittest.TestCase):
     def test_creation_multienv(self):
@@ -126,6 +225,22 @@ class TestSingleEnvMultiProcess(unittest.TestCase):
                 assert np.all(seeds_1 == seeds_3)
                 assert np.any(seeds_1 != seeds_2)
 
+    def test_step_async(self):
+        nb_env = 2
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with make("rte_case5_example", test=True) as env:
+                multi_envs = SingleEnvMultiProcess(env=env, nb_env=nb_env)
+                multi_envs.reset()
+                multi_envs.step_async([env.action_space() for _ in range(nb_env)])
+                env_ids, obss, rewards, dones, infos = multi_envs.step_wait_first(
+                    nb_env_ready=nb_env
+                )
+                assert np.all(env_ids == np.arange(nb_env))
+                for ob in obss:
+                    assert isinstance(ob, CompleteObservation)
+                multi_envs.close()
+
 
 class TestMultiEnvMultiProcess(unittest.TestCase):
     def test_creation_multienv(self):
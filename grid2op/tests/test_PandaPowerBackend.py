@@ -14,6 +14,7 @@ from grid2op import make
 
 from grid2op.tests.helper_path_test import PATH_DATA_TEST_PP, PATH_DATA_TEST
 from grid2op.Backend import PandaPowerBackend
+from grid2op.Exceptions import BackendError
 
 from grid2op.tests.helper_path_test import HelperTests
 from grid2op.tests.BaseBackendTest import BaseTestNames
@@ -238,5 +239,139 @@ class TestChangeBusAffectRightBus2(unittest.TestCase):
         assert env.backend._grid["trafo"]["hv_bus"][2] == 4
 
 
+class TestApplyTopoVectorized(unittest.TestCase):
+    """test that the vectorized topology update gives the same results as the element by element one"""
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make("l2rpn_case14_sandbox", test=True)
+
+    def tearDown(self) -> None:
+        self.env.close()
+
+    def _apply_elementwise(self, backend, topo__):
+        for id_el, new_bus in topo__:
+            id_el_backend, id_topo, type_obj = backend._big_topo_to_backend[id_el]
+            if type_obj is not None:
+                backend._type_to_bus_set[type_obj](new_bus, id_el_backend, id_topo)
+
+    def _aux_check(self, act):
+        backend_vect = self.env.backend.copy()
+        backend_ref = self.env.backend.copy()
+        bk_act = self.env._backend_action_class()
+        bk_act += act
+        backend_vect.apply_action(bk_act)
+        *_, topo__, _ = bk_act()
+        self._apply_elementwise(backend_ref, topo__)
+        for table, cols in [("load", ["bus", "in_service"]),
+                            ("gen", ["bus", "in_service"]),
+                            ("line", ["from_bus", "to_bus", "in_service"]),
+                            ("trafo", ["hv_bus", "lv_bus", "in_service"]),
+                            ("ext_grid", ["bus"]),
+                            ]:
+            for col in cols:
+                assert np.array_equal(backend_vect._grid[table][col].values,
+                                      backend_ref._grid[table][col].values), f"error for {table}[{col}]"
+        return backend_vect
+
+    def test_set_bus(self):
+        act = self.env.action_space({"set_bus": {"substations_id": [(1, [1, 2, 2, 1, 1, 2]),
+                                                                    (5, [1, 1, 2, 2, 1, 2, 2])]}})
+        backend = self._aux_check(act)
+        bus_is = backend._grid.bus["in_service"].values
+        assert np.sum(bus_is) == self.env.n_sub + 2
+
+    def test_disconnect_lines(self):
+        act = self.env.action_space({"set_line_status": [(0, -1), (17, -1), (19, -1)]})
+        backend = self._aux_check(act)
+        assert not np.any(backend._get_line_status()[[0, 17, 19]])
+
+    def test_change_slack_bus(self):
+        gen_id = self.env.n_gen - 1
+        sub_id = self.env.gen_to_subid[gen_id]
+        topo = np.ones(self.env.sub_info[sub_id], dtype=int)
+        topo[self.env.gen_to_sub_pos[gen_id]] = 2
+        act = self.env.action_space({"set_bus": {"substations_id": [(sub_id, topo)]}})
+        backend = self._aux_check(act)
+        assert backend._grid.gen["bus"].iat[gen_id] == backend._init_bus_gen[gen_id] + self.env.n_sub
+
+    def test_wrong_bus(self):
+        backend = self.env.backend
+        topo_values = np.ones(self.env.dim_topo, dtype=int)
+        topo_values[backend.load_pos_topo_vect[0]] = 3
+        topo_changed = np.full(self.env.dim_topo, fill_value=True)
+        with self.assertRaises(BackendError):
+            backend._aux_get_new_pp_bus(backend.load_pos_topo_vect, backend._init_bus_load,
+                                        topo_changed, topo_values)
+
+
+class TestResultsFromPPC(unittest.TestCase):
+    """test that the flows read from the pandapower "ppc" are the same as the ones in the result tables"""
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make("l2rpn_case14_sandbox", test=True)
+
+    def tearDown(self) -> None:
+        self.env.close()
+
+    def _aux_check(self, act, is_dc):
+        backend = self.env.backend.copy()
+        bk_act = self.env._backend_action_class()
+        bk_act += act
+        backend.apply_action(bk_act)
+        conv, exc_ = backend.runpf(is_dc=is_dc)
+        assert conv, f"powerflow diverged with {exc_}"
+        for attr_nm, col_line, col_trafo, mult in [("p_or", "p_from_mw", "p_hv_mw", 1.),
+                                                   ("q_or", "q_from_mvar", "q_hv_mvar", 1.),
+                                                   ("a_or", "i_from_ka", "i_hv_ka", 1000.),
+                                                   ("theta_or", "va_from_degree", "va_hv_degree", 1.),
+                                                   ("p_ex", "p_to_mw", "p_lv_mw", 1.),
+                                                   ("q_ex", "q_to_mvar", "q_lv_mvar", 1.),
+                                                   ("a_ex", "i_to_ka", "i_lv_ka", 1000.),
+                                                   ("theta_ex", "va_to_degree", "va_lv_degree", 1.),
+                                                   ]:
+            ref = mult * backend._aux_get_line_info(col_line, col_trafo)
+            ref[~np.isfinite(ref)] = 0.
+            val = getattr(backend, attr_nm)
+            val[~np.isfinite(val)] = 0.
+            assert np.allclose(val, ref, atol=1e-4), f"error for {attr_nm}"
+
+        for attr_nm, col_line, col_trafo, pu_to_kv in [("v_or", "vm_from_pu", "vm_hv_pu", backend.lines_or_pu_to_kv),
+                                                       ("v_ex", "vm_to_pu", "vm_lv_pu", backend.lines_ex_pu_to_kv)]:
+            ref = backend._aux_get_line_info(col_line, col_trafo)
+            ref[~np.isfinite(ref)] = 0.
+            ref[~backend.line_status] = 0.
+            assert np.allclose(getattr(backend, attr_nm), ref * pu_to_kv, atol=1e-4), f"error for {attr_nm}"
+        return backend
+
+    def test_ac(self):
+        self._aux_check(self.env.action_space(), is_dc=False)
+        self._aux_check(self.env.action_space({"set_line_status": [(3, -1), (17, -1)]}), is_dc=False)
+        self._aux_check(self.env.action_space({"set_bus": {"substations_id": [(1, [1, 2, 2, 1, 1, 2])]}}),
+                        is_dc=False)
+
+    def test_dc(self):
+        self._aux_check(self.env.action_space(), is_dc=True)
+        self._aux_check(self.env.action_space({"set_line_status": [(3, -1), (17, -1)]}), is_dc=True)
+
+    def test_dc_load_v(self):
+        # load 0 and generator 0 are both in substation 1
+        load_id = 0
+        gen_id = 0
+        sub_id = self.env.load_to_subid[load_id]
+        assert self.env.gen_to_subid[gen_id] == sub_id
+        backend = self._aux_check(self.env.action_space(), is_dc=True)
+        assert abs(backend.load_v[load_id] - backend.prod_v[gen_id]) <= 1e-5
+
+        # now the load is moved to bus 2, it is not connected to the generator anymore
+        topo = np.ones(self.env.sub_info[sub_id], dtype=int)
+        topo[self.env.load_to_sub_pos[load_id]] = 2
+        topo[self.env.line_or_to_sub_pos[self.env.line_or_to_subid == sub_id][0]] = 2
+        act = self.env.action_space({"set_bus": {"substations_id": [(sub_id, topo)]}})
+        backend = self._aux_check(act, is_dc=True)
+        assert abs(backend.load_v[load_id] - backend.load_pu_to_kv[load_id]) <= 1e-5
+
+
 if __name__ == "__main__":
     unittest.main()
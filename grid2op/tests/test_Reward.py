@@ -288,6 +288,21 @@ class TestN1Reward(unittest.TestCase):
             ), f"the correct reward has not been computed for line {l_id}"
         env.close()
 
+    def test_backend_not_modified(self):
+        L_ID = 2
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = make(
+                "l2rpn_case14_sandbox", reward_class=N1Reward(l_id=L_ID), test=True
+            )
+        assert env.backend.can_snapshot
+        assert env._reward_helper.template_reward.backend is None
+        obs, reward, *_ = env.step(env.action_space())
+        # the backend of the environment is left untouched by the reward
+        assert env.backend.get_line_status()[L_ID]
+        assert np.allclose(env.backend.get_relative_flow(), obs.rho, atol=1e-5)
+        env.close()
+
 
 if __name__ == "__main__":
     unittest.main()
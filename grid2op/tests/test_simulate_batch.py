@@ -0,0 +1,95 @@
+# Copyright (c) 2019-2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import grid2op
+import unittest
+import warnings
+import numpy as np
+from grid2op.Parameters import Parameters
+from grid2op.Exceptions import NoForecastAvailable, SimulateUsedTooMuchThisStep
+
+
+class TestSimulateBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True)
+        self.env.seed(0)
+        self.obs = self.env.reset()
+        self.actions = [
+            self.env.action_space(),
+            self.env.action_space({"set_line_status": [(0, -1)]}),
+            self.env.action_space({"set_bus": {"substations_id": [(1, (1, 2, 2, 1, 1, 2))]}}),
+            self.env.action_space({"redispatch": [(0, 2.0)]}),
+        ]
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_compare(self, build_obs):
+        rho, reward, done, has_exc = self.obs.simulate_batch(self.actions, build_obs=build_obs)
+        assert rho.shape == (len(self.actions), self.env.n_line)
+        assert reward.shape == (len(self.actions),)
+        assert done.shape == (len(self.actions),)
+        assert has_exc.shape == (len(self.actions),)
+        for act_id, act in enumerate(self.actions):
+            sim_obs, sim_r, sim_d, sim_i = self.obs.simulate(act)
+            assert np.allclose(rho[act_id], sim_obs.rho), f"error for action {act_id}"
+            assert abs(reward[act_id] - sim_r) <= 1e-5, f"error for action {act_id}"
+            assert done[act_id] == sim_d, f"error for action {act_id}"
+            assert has_exc[act_id] == (len(sim_i["exception"]) > 0), f"error for action {act_id}"
+
+    def test_same_as_simulate(self):
+        self._aux_compare(build_obs=True)
+
+    def test_same_as_simulate_no_obs(self):
+        self._aux_compare(build_obs=False)
+
+    def test_order_does_not_matter(self):
+        """test that the state is properly reset between two actions of the batch"""
+        res = self.obs.simulate_batch(self.actions)
+        res_rev = self.obs.simulate_batch(self.actions[::-1])
+        for arr, arr_rev in zip(res, res_rev):
+            assert np.allclose(arr, arr_rev[::-1])
+
+    def test_simulate_after_batch(self):
+        """test that a call to simulate is not affected by a previous call to simulate_batch"""
+        sim_obs_ref, *_ = self.obs.simulate(self.actions[1])
+        self.obs.simulate_batch(self.actions, build_obs=False)
+        sim_obs, *_ = self.obs.simulate(self.actions[1])
+        assert sim_obs == sim_obs_ref
+
+    def test_game_over(self):
+        act = self.env.action_space({"set_bus": {"loads_id": [(0, -1)]}})
+        rho, reward, done, has_exc = self.obs.simulate_batch([act, self.env.action_space()])
+        assert done[0]
+        assert has_exc[0]
+        assert np.all(rho[0] == 0.)
+        assert not done[1]
+        assert np.all(rho[1] > 0.)
+
+    def test_time_step(self):
+        with self.assertRaises(NoForecastAvailable):
+            self.obs.simulate_batch(self.actions, time_step=2)
+
+    def test_count_simulate(self):
+        assert self.env.observation_space.nb_simulate_called_this_step == 0
+        self.obs.simulate_batch(self.actions)
+        assert self.env.observation_space.nb_simulate_called_this_step == len(self.actions)
+
+        param = Parameters()
+        param.MAX_SIMULATE_PER_STEP = 2
+        self.env.change_parameters(param)
+        obs = self.env.reset()
+        with self.assertRaises(SimulateUsedTooMuchThisStep):
+            obs.simulate_batch(self.actions)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# Copyright (c) 2019-2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import grid2op
+import unittest
+import warnings
+import numpy as np
+from grid2op.Parameters import Parameters
+from grid2op.Exceptions import SimulateUsedTooMuchThisStep
+
+
+class TestSimulatePool(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True)
+        self.env.seed(0)
+        self.env.reset()
+        self.actions = [
+            self.env.action_space(),
+            self.env.action_space({"set_line_status": [(0, -1)]}),
+            self.env.action_space({"set_bus": {"substations_id": [(1, (1, 2, 2, 1, 1, 2))]}}),
+            self.env.action_space({"redispatch": [(0, 2.0)]}),
+            self.env.action_space({"set_bus": {"loads_id": [(0, -1)]}}),
+        ]
+        self.env.observation_space.start_simulate_pool(2)
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_compare(self, obs):
+        rho, reward, done, has_exc = obs.simulate_batch(self.actions)
+        assert rho.shape == (len(self.actions), self.env.n_line)
+        for act_id, act in enumerate(self.actions):
+            sim_obs, sim_r, sim_d, sim_i = obs.simulate(act)
+            if not sim_d:
+                assert np.allclose(rho[act_id], sim_obs.rho), f"error for action {act_id}"
+            else:
+                assert np.all(rho[act_id] == 0.), f"error for action {act_id}"
+            assert abs(reward[act_id] - sim_r) <= 1e-5, f"error for action {act_id}"
+            assert done[act_id] == sim_d, f"error for action {act_id}"
+            assert has_exc[act_id] == (len(sim_i["exception"]) > 0), f"error for action {act_id}"
+
+    def test_same_as_serial(self):
+        obs = self.env.get_obs()
+        self._aux_compare(obs)
+        # state is properly synchronized
+        for _ in range(3):
+            obs, *_ = self.env.step(self.env.action_space({"set_line_status": [(2, -1)]}))
+        self._aux_compare(obs)
+
+    def test_close_pool(self):
+        obs = self.env.get_obs()
+        res_pool = obs.simulate_batch(self.actions)
+        self.env.observation_space.close_simulate_pool()
+        assert self.env.observation_space.obs_env._simulate_pool is None
+        res_serial = obs.simulate_batch(self.actions)
+        for arr_pool, arr_serial in zip(res_pool, res_serial):
+            assert np.allclose(arr_pool, arr_serial)
+
+    def test_less_actions_than_process(self):
+        self.env.observation_space.start_simulate_pool(8)
+        obs = self.env.get_obs()
+        rho, reward, done, has_exc = obs.simulate_batch(self.actions[:3])
+        assert rho.shape == (3, self.env.n_line)
+        rho, reward, done, has_exc = obs.simulate_batch([])
+        assert rho.shape == (0, self.env.n_line)
+
+    def test_count_simulate(self):
+        param = Parameters()
+        param.MAX_SIMULATE_PER_STEP = 2
+        self.env.change_parameters(param)
+        obs = self.env.reset()
+        with self.assertRaises(SimulateUsedTooMuchThisStep):
+            obs.simulate_batch(self.actions)
+
+    def test_change_forecast_parameters(self):
+        param = Parameters()
+        param.MAX_LINE_STATUS_CHANGED = 2
+        param.MAX_SUB_CHANGED = 2
+        self.env.change_forecast_parameters(param)
+        obs = self.env.reset()
+        act = self.env.action_space({"set_bus": {"substations_id": [(1, (1, 2, 2, 1, 1, 2)),
+                                                                     (5, (1, 2, 2, 1, 1, 2, 1))]}})
+        self.actions.append(act)
+        self._aux_compare(obs)
+
+
+if __name__ == "__main__":
+    unittest.main()